@@ -4,7 +4,8 @@ set -e
 
 cd "$(dirname "$0")"
 
-poetry run openapi-python-client generate --path ../openapi.json
+# Custom templates in ./templates override the stock openapi-python-client ones
+poetry run openapi-python-client generate --path ../openapi.json --custom-template-path=templates
 
 rm -rf openpipe/api_client
 mv open-pipe-api-client/open_pipe_api_client openpipe/api_client
@@ -2,3 +2,4 @@
 from openai import *
 from .openai_sync_wrapper import OpenAIWrapper as OpenAI
 from .openai_async_wrapper import AsyncOpenAIWrapper as AsyncOpenAI
+from .shared import flush, flush_async
@@ -1,17 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union
+from typing import Any, Dict, Type, TypeVar, Union
 
 from attrs import define
 
+from ..models.check_cache_json_body_tags import CheckCacheJsonBodyTags
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.check_cache_json_body_tags import CheckCacheJsonBodyTags
-
-
 T = TypeVar("T", bound="CheckCacheJsonBody")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CheckCacheJsonBody:
     """
     Attributes:
@@ -26,20 +23,15 @@ class CheckCacheJsonBody:
     tags: Union[Unset, "CheckCacheJsonBodyTags"] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        requested_at = self.requested_at
-        req_payload = self.req_payload
         tags: Union[Unset, Dict[str, Any]] = UNSET
         if not isinstance(self.tags, Unset):
             tags = self.tags.to_dict()
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "requestedAt": requested_at,
-            }
-        )
-        if req_payload is not UNSET:
-            field_dict["reqPayload"] = req_payload
+        field_dict: Dict[str, Any] = {
+            "requestedAt": self.requested_at,
+        }
+        if self.req_payload is not UNSET:
+            field_dict["reqPayload"] = self.req_payload
         if tags is not UNSET:
             field_dict["tags"] = tags
 
@@ -47,14 +39,11 @@ class CheckCacheJsonBody:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.check_cache_json_body_tags import CheckCacheJsonBodyTags
-
-        d = src_dict.copy()
-        requested_at = d.pop("requestedAt")
+        requested_at = src_dict["requestedAt"]
 
-        req_payload = d.pop("reqPayload", UNSET)
+        req_payload = src_dict.get("reqPayload", UNSET)
 
-        _tags = d.pop("tags", UNSET)
+        _tags = src_dict.get("tags", UNSET)
         tags: Union[Unset, CheckCacheJsonBodyTags]
         if isinstance(_tags, Unset):
             tags = UNSET
@@ -1,42 +1,35 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Type, TypeVar, Union
 
 from attrs import define
 
 from ..models.create_chat_completion_json_body_function_call_type_0 import CreateChatCompletionJsonBodyFunctionCallType0
 from ..models.create_chat_completion_json_body_function_call_type_1 import CreateChatCompletionJsonBodyFunctionCallType1
+from ..models.create_chat_completion_json_body_function_call_type_2 import CreateChatCompletionJsonBodyFunctionCallType2
+from ..models.create_chat_completion_json_body_functions_item import CreateChatCompletionJsonBodyFunctionsItem
+from ..models.create_chat_completion_json_body_messages_item_type_0 import CreateChatCompletionJsonBodyMessagesItemType0
+from ..models.create_chat_completion_json_body_messages_item_type_1 import CreateChatCompletionJsonBodyMessagesItemType1
+from ..models.create_chat_completion_json_body_messages_item_type_2 import CreateChatCompletionJsonBodyMessagesItemType2
+from ..models.create_chat_completion_json_body_messages_item_type_3 import CreateChatCompletionJsonBodyMessagesItemType3
+from ..models.create_chat_completion_json_body_messages_item_type_4 import CreateChatCompletionJsonBodyMessagesItemType4
+from ..models.create_chat_completion_json_body_req_payload import CreateChatCompletionJsonBodyReqPayload
 from ..models.create_chat_completion_json_body_tool_choice_type_0 import CreateChatCompletionJsonBodyToolChoiceType0
 from ..models.create_chat_completion_json_body_tool_choice_type_1 import CreateChatCompletionJsonBodyToolChoiceType1
+from ..models.create_chat_completion_json_body_tool_choice_type_2 import CreateChatCompletionJsonBodyToolChoiceType2
+from ..models.create_chat_completion_json_body_tools_item import CreateChatCompletionJsonBodyToolsItem
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_function_call_type_2 import (
-        CreateChatCompletionJsonBodyFunctionCallType2,
-    )
-    from ..models.create_chat_completion_json_body_functions_item import CreateChatCompletionJsonBodyFunctionsItem
-    from ..models.create_chat_completion_json_body_messages_item_type_0 import (
-        CreateChatCompletionJsonBodyMessagesItemType0,
-    )
-    from ..models.create_chat_completion_json_body_messages_item_type_1 import (
-        CreateChatCompletionJsonBodyMessagesItemType1,
-    )
-    from ..models.create_chat_completion_json_body_messages_item_type_2 import (
-        CreateChatCompletionJsonBodyMessagesItemType2,
-    )
-    from ..models.create_chat_completion_json_body_messages_item_type_3 import (
-        CreateChatCompletionJsonBodyMessagesItemType3,
-    )
-    from ..models.create_chat_completion_json_body_messages_item_type_4 import (
-        CreateChatCompletionJsonBodyMessagesItemType4,
-    )
-    from ..models.create_chat_completion_json_body_req_payload import CreateChatCompletionJsonBodyReqPayload
-    from ..models.create_chat_completion_json_body_tool_choice_type_2 import CreateChatCompletionJsonBodyToolChoiceType2
-    from ..models.create_chat_completion_json_body_tools_item import CreateChatCompletionJsonBodyToolsItem
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBody")
 
+_MESSAGES_ITEM_TYPES: Dict[str, Any] = {
+    "system": CreateChatCompletionJsonBodyMessagesItemType0,
+    "user": CreateChatCompletionJsonBodyMessagesItemType1,
+    "assistant": CreateChatCompletionJsonBodyMessagesItemType2,
+    "tool": CreateChatCompletionJsonBodyMessagesItemType3,
+    "function": CreateChatCompletionJsonBodyMessagesItemType4,
+}
+
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBody:
     """
     Attributes:
@@ -91,44 +84,15 @@ class CreateChatCompletionJsonBody:
     stream: Union[Unset, None, bool] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        from ..models.create_chat_completion_json_body_messages_item_type_0 import (
-            CreateChatCompletionJsonBodyMessagesItemType0,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_1 import (
-            CreateChatCompletionJsonBodyMessagesItemType1,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_2 import (
-            CreateChatCompletionJsonBodyMessagesItemType2,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_3 import (
-            CreateChatCompletionJsonBodyMessagesItemType3,
-        )
-
         req_payload: Union[Unset, Dict[str, Any]] = UNSET
         if not isinstance(self.req_payload, Unset):
             req_payload = self.req_payload.to_dict()
 
-        model = self.model
         messages: Union[Unset, List[Dict[str, Any]]] = UNSET
         if not isinstance(self.messages, Unset):
             messages = []
             for messages_item_data in self.messages:
-                messages_item: Dict[str, Any]
-
-                if isinstance(messages_item_data, CreateChatCompletionJsonBodyMessagesItemType0):
-                    messages_item = messages_item_data.to_dict()
-
-                elif isinstance(messages_item_data, CreateChatCompletionJsonBodyMessagesItemType1):
-                    messages_item = messages_item_data.to_dict()
-
-                elif isinstance(messages_item_data, CreateChatCompletionJsonBodyMessagesItemType2):
-                    messages_item = messages_item_data.to_dict()
-
-                elif isinstance(messages_item_data, CreateChatCompletionJsonBodyMessagesItemType3):
-                    messages_item = messages_item_data.to_dict()
-
-                else:
-                    messages_item = messages_item_data.to_dict()
+                messages_item = messages_item_data.to_dict()
 
                 messages.append(messages_item)
 
@@ -186,17 +150,11 @@ class CreateChatCompletionJsonBody:
 
                 tools.append(tools_item)
 
-        n = self.n
-        max_tokens = self.max_tokens
-        temperature = self.temperature
-        stream = self.stream
-
         field_dict: Dict[str, Any] = {}
-        field_dict.update({})
         if req_payload is not UNSET:
             field_dict["reqPayload"] = req_payload
-        if model is not UNSET:
-            field_dict["model"] = model
+        if self.model is not UNSET:
+            field_dict["model"] = self.model
         if messages is not UNSET:
             field_dict["messages"] = messages
         if function_call is not UNSET:
@@ -207,106 +165,38 @@ class CreateChatCompletionJsonBody:
             field_dict["tool_choice"] = tool_choice
         if tools is not UNSET:
             field_dict["tools"] = tools
-        if n is not UNSET:
-            field_dict["n"] = n
-        if max_tokens is not UNSET:
-            field_dict["max_tokens"] = max_tokens
-        if temperature is not UNSET:
-            field_dict["temperature"] = temperature
-        if stream is not UNSET:
-            field_dict["stream"] = stream
+        if self.n is not UNSET:
+            field_dict["n"] = self.n
+        if self.max_tokens is not UNSET:
+            field_dict["max_tokens"] = self.max_tokens
+        if self.temperature is not UNSET:
+            field_dict["temperature"] = self.temperature
+        if self.stream is not UNSET:
+            field_dict["stream"] = self.stream
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_function_call_type_2 import (
-            CreateChatCompletionJsonBodyFunctionCallType2,
-        )
-        from ..models.create_chat_completion_json_body_functions_item import CreateChatCompletionJsonBodyFunctionsItem
-        from ..models.create_chat_completion_json_body_messages_item_type_0 import (
-            CreateChatCompletionJsonBodyMessagesItemType0,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_1 import (
-            CreateChatCompletionJsonBodyMessagesItemType1,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_2 import (
-            CreateChatCompletionJsonBodyMessagesItemType2,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_3 import (
-            CreateChatCompletionJsonBodyMessagesItemType3,
-        )
-        from ..models.create_chat_completion_json_body_messages_item_type_4 import (
-            CreateChatCompletionJsonBodyMessagesItemType4,
-        )
-        from ..models.create_chat_completion_json_body_req_payload import CreateChatCompletionJsonBodyReqPayload
-        from ..models.create_chat_completion_json_body_tool_choice_type_2 import (
-            CreateChatCompletionJsonBodyToolChoiceType2,
-        )
-        from ..models.create_chat_completion_json_body_tools_item import CreateChatCompletionJsonBodyToolsItem
-
-        d = src_dict.copy()
-        _req_payload = d.pop("reqPayload", UNSET)
+        _req_payload = src_dict.get("reqPayload", UNSET)
         req_payload: Union[Unset, CreateChatCompletionJsonBodyReqPayload]
         if isinstance(_req_payload, Unset):
             req_payload = UNSET
         else:
             req_payload = CreateChatCompletionJsonBodyReqPayload.from_dict(_req_payload)
 
-        model = d.pop("model", UNSET)
+        model = src_dict.get("model", UNSET)
 
         messages = []
-        _messages = d.pop("messages", UNSET)
+        _messages = src_dict.get("messages", UNSET)
         for messages_item_data in _messages or []:
-
-            def _parse_messages_item(
-                data: object,
-            ) -> Union[
-                "CreateChatCompletionJsonBodyMessagesItemType0",
-                "CreateChatCompletionJsonBodyMessagesItemType1",
-                "CreateChatCompletionJsonBodyMessagesItemType2",
-                "CreateChatCompletionJsonBodyMessagesItemType3",
-                "CreateChatCompletionJsonBodyMessagesItemType4",
-            ]:
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_0 = CreateChatCompletionJsonBodyMessagesItemType0.from_dict(data)
-
-                    return messages_item_type_0
-                except:  # noqa: E722
-                    pass
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_1 = CreateChatCompletionJsonBodyMessagesItemType1.from_dict(data)
-
-                    return messages_item_type_1
-                except:  # noqa: E722
-                    pass
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_2 = CreateChatCompletionJsonBodyMessagesItemType2.from_dict(data)
-
-                    return messages_item_type_2
-                except:  # noqa: E722
-                    pass
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_3 = CreateChatCompletionJsonBodyMessagesItemType3.from_dict(data)
-
-                    return messages_item_type_3
-                except:  # noqa: E722
-                    pass
-                if not isinstance(data, dict):
-                    raise TypeError()
-                messages_item_type_4 = CreateChatCompletionJsonBodyMessagesItemType4.from_dict(data)
-
-                return messages_item_type_4
-
-            messages_item = _parse_messages_item(messages_item_data)
+            if not isinstance(messages_item_data, dict):
+                raise TypeError()
+            # An unknown role falls back to the last variant, which rejects it as the old trial parsing did
+            messages_item_type = _MESSAGES_ITEM_TYPES.get(
+                messages_item_data.get("role"), CreateChatCompletionJsonBodyMessagesItemType4
+            )
+            messages_item = messages_item_type.from_dict(messages_item_data)
 
             messages.append(messages_item)
 
@@ -357,10 +247,10 @@ class CreateChatCompletionJsonBody:
 
             return function_call_type_2
 
-        function_call = _parse_function_call(d.pop("function_call", UNSET))
+        function_call = _parse_function_call(src_dict.get("function_call", UNSET))
 
         functions = []
-        _functions = d.pop("functions", UNSET)
+        _functions = src_dict.get("functions", UNSET)
         for functions_item_data in _functions or []:
             functions_item = CreateChatCompletionJsonBodyFunctionsItem.from_dict(functions_item_data)
 
@@ -413,22 +303,22 @@ class CreateChatCompletionJsonBody:
 
             return tool_choice_type_2
 
-        tool_choice = _parse_tool_choice(d.pop("tool_choice", UNSET))
+        tool_choice = _parse_tool_choice(src_dict.get("tool_choice", UNSET))
 
         tools = []
-        _tools = d.pop("tools", UNSET)
+        _tools = src_dict.get("tools", UNSET)
         for tools_item_data in _tools or []:
             tools_item = CreateChatCompletionJsonBodyToolsItem.from_dict(tools_item_data)
 
             tools.append(tools_item)
 
-        n = d.pop("n", UNSET)
+        n = src_dict.get("n", UNSET)
 
-        max_tokens = d.pop("max_tokens", UNSET)
+        max_tokens = src_dict.get("max_tokens", UNSET)
 
-        temperature = d.pop("temperature", UNSET)
+        temperature = src_dict.get("temperature", UNSET)
 
-        stream = d.pop("stream", UNSET)
+        stream = src_dict.get("stream", UNSET)
 
         create_chat_completion_json_body = cls(
             req_payload=req_payload,
@@ -1,19 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union
+from typing import Any, Dict, Type, TypeVar, Union
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_functions_item_parameters import (
+    CreateChatCompletionJsonBodyFunctionsItemParameters,
+)
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_functions_item_parameters import (
-        CreateChatCompletionJsonBodyFunctionsItemParameters,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyFunctionsItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyFunctionsItem:
     """
     Attributes:
@@ -27,35 +24,22 @@ class CreateChatCompletionJsonBodyFunctionsItem:
     description: Union[Unset, str] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        name = self.name
-        parameters = self.parameters.to_dict()
-
-        description = self.description
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "name": name,
-                "parameters": parameters,
-            }
-        )
-        if description is not UNSET:
-            field_dict["description"] = description
+        field_dict: Dict[str, Any] = {
+            "name": self.name,
+            "parameters": self.parameters.to_dict(),
+        }
+        if self.description is not UNSET:
+            field_dict["description"] = self.description
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_functions_item_parameters import (
-            CreateChatCompletionJsonBodyFunctionsItemParameters,
-        )
-
-        d = src_dict.copy()
-        name = d.pop("name")
+        name = src_dict["name"]
 
-        parameters = CreateChatCompletionJsonBodyFunctionsItemParameters.from_dict(d.pop("parameters"))
+        parameters = CreateChatCompletionJsonBodyFunctionsItemParameters.from_dict(src_dict["parameters"])
 
-        description = d.pop("description", UNSET)
+        description = src_dict.get("description", UNSET)
 
         create_chat_completion_json_body_functions_item = cls(
             name=name,
@@ -13,7 +13,7 @@ from ..types import UNSET
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyMessagesItemType0")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyMessagesItemType0:
     """
     Attributes:
@@ -25,8 +25,6 @@ class CreateChatCompletionJsonBodyMessagesItemType0:
     content: Union[CreateChatCompletionJsonBodyMessagesItemType0ContentType1, str]
 
     def to_dict(self) -> Dict[str, Any]:
-        role = self.role.value
-
         content: str
 
         if isinstance(self.content, CreateChatCompletionJsonBodyMessagesItemType0ContentType1):
@@ -35,20 +33,14 @@ class CreateChatCompletionJsonBodyMessagesItemType0:
         else:
             content = self.content
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "content": content,
-            }
-        )
-
-        return field_dict
+        return {
+            "role": self.role.value,
+            "content": content,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        role = CreateChatCompletionJsonBodyMessagesItemType0Role(d.pop("role"))
+        role = CreateChatCompletionJsonBodyMessagesItemType0Role(src_dict["role"])
 
         def _parse_content(data: object) -> Union[CreateChatCompletionJsonBodyMessagesItemType0ContentType1, str]:
             try:
@@ -66,7 +58,7 @@ class CreateChatCompletionJsonBodyMessagesItemType0:
                 pass
             return cast(Union[CreateChatCompletionJsonBodyMessagesItemType0ContentType1, str], data)
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
         create_chat_completion_json_body_messages_item_type_0 = cls(
             role=role,
@@ -16,7 +16,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyMessagesItemType1ContentType1ItemType0ImageUrl")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyMessagesItemType1ContentType1ItemType0ImageUrl:
     """
     Attributes:
@@ -35,7 +35,6 @@ class CreateChatCompletionJsonBodyMessagesItemType1ContentType1ItemType0ImageUrl
     ] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        url = self.url
         detail: Union[Unset, str]
         if isinstance(self.detail, Unset):
             detail = UNSET
@@ -59,12 +58,9 @@ class CreateChatCompletionJsonBodyMessagesItemType1ContentType1ItemType0ImageUrl
             if not isinstance(self.detail, Unset):
                 detail = self.detail.value
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "url": url,
-            }
-        )
+        field_dict: Dict[str, Any] = {
+            "url": self.url,
+        }
         if detail is not UNSET:
             field_dict["detail"] = detail
 
@@ -72,8 +68,7 @@ class CreateChatCompletionJsonBodyMessagesItemType1ContentType1ItemType0ImageUrl
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        url = d.pop("url")
+        url = src_dict["url"]
 
         def _parse_detail(
             data: object,
@@ -138,7 +133,7 @@ class CreateChatCompletionJsonBodyMessagesItemType1ContentType1ItemType0ImageUrl
 
             return detail_type_2
 
-        detail = _parse_detail(d.pop("detail", UNSET))
+        detail = _parse_detail(src_dict.get("detail", UNSET))
 
         create_chat_completion_json_body_messages_item_type_1_content_type_1_item_type_0_image_url = cls(
             url=url,
@@ -5,7 +5,7 @@ from attrs import define
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyMessagesItemType2FunctionCall")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyMessagesItemType2FunctionCall:
     """
     Attributes:
@@ -17,25 +17,16 @@ class CreateChatCompletionJsonBodyMessagesItemType2FunctionCall:
     arguments: str
 
     def to_dict(self) -> Dict[str, Any]:
-        name = self.name
-        arguments = self.arguments
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "name": name,
-                "arguments": arguments,
-            }
-        )
-
-        return field_dict
+        return {
+            "name": self.name,
+            "arguments": self.arguments,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        name = src_dict["name"]
 
-        arguments = d.pop("arguments")
+        arguments = src_dict["arguments"]
 
         create_chat_completion_json_body_messages_item_type_2_function_call = cls(
             name=name,
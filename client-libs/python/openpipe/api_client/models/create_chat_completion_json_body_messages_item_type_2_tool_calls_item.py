@@ -1,21 +1,18 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_messages_item_type_2_tool_calls_item_function import (
+    CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemFunction,
+)
 from ..models.create_chat_completion_json_body_messages_item_type_2_tool_calls_item_type import (
     CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemType,
 )
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_messages_item_type_2_tool_calls_item_function import (
-        CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemFunction,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItem:
     """
     Attributes:
@@ -29,34 +26,19 @@ class CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItem:
     type: CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemType
 
     def to_dict(self) -> Dict[str, Any]:
-        id = self.id
-        function = self.function.to_dict()
-
-        type = self.type.value
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "id": id,
-                "function": function,
-                "type": type,
-            }
-        )
-
-        return field_dict
+        return {
+            "id": self.id,
+            "function": self.function.to_dict(),
+            "type": self.type.value,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_messages_item_type_2_tool_calls_item_function import (
-            CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemFunction,
-        )
-
-        d = src_dict.copy()
-        id = d.pop("id")
+        id = src_dict["id"]
 
-        function = CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemFunction.from_dict(d.pop("function"))
+        function = CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemFunction.from_dict(src_dict["function"])
 
-        type = CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemType(d.pop("type"))
+        type = CreateChatCompletionJsonBodyMessagesItemType2ToolCallsItemType(src_dict["type"])
 
         create_chat_completion_json_body_messages_item_type_2_tool_calls_item = cls(
             id=id,
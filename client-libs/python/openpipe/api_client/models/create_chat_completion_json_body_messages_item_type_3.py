@@ -13,7 +13,7 @@ from ..types import UNSET
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyMessagesItemType3")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyMessagesItemType3:
     """
     Attributes:
@@ -27,8 +27,6 @@ class CreateChatCompletionJsonBodyMessagesItemType3:
     tool_call_id: str
 
     def to_dict(self) -> Dict[str, Any]:
-        role = self.role.value
-
         content: str
 
         if isinstance(self.content, CreateChatCompletionJsonBodyMessagesItemType3ContentType1):
@@ -37,23 +35,15 @@ class CreateChatCompletionJsonBodyMessagesItemType3:
         else:
             content = self.content
 
-        tool_call_id = self.tool_call_id
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "content": content,
-                "tool_call_id": tool_call_id,
-            }
-        )
-
-        return field_dict
+        return {
+            "role": self.role.value,
+            "content": content,
+            "tool_call_id": self.tool_call_id,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        role = CreateChatCompletionJsonBodyMessagesItemType3Role(d.pop("role"))
+        role = CreateChatCompletionJsonBodyMessagesItemType3Role(src_dict["role"])
 
         def _parse_content(data: object) -> Union[CreateChatCompletionJsonBodyMessagesItemType3ContentType1, str]:
             try:
@@ -71,9 +61,9 @@ class CreateChatCompletionJsonBodyMessagesItemType3:
                 pass
             return cast(Union[CreateChatCompletionJsonBodyMessagesItemType3ContentType1, str], data)
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
-        tool_call_id = d.pop("tool_call_id")
+        tool_call_id = src_dict["tool_call_id"]
 
         create_chat_completion_json_body_messages_item_type_3 = cls(
             role=role,
@@ -13,7 +13,7 @@ from ..types import UNSET
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyMessagesItemType4")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyMessagesItemType4:
     """
     Attributes:
@@ -27,9 +27,6 @@ class CreateChatCompletionJsonBodyMessagesItemType4:
     content: Union[CreateChatCompletionJsonBodyMessagesItemType4ContentType1, str]
 
     def to_dict(self) -> Dict[str, Any]:
-        role = self.role.value
-
-        name = self.name
         content: str
 
         if isinstance(self.content, CreateChatCompletionJsonBodyMessagesItemType4ContentType1):
@@ -38,23 +35,17 @@ class CreateChatCompletionJsonBodyMessagesItemType4:
         else:
             content = self.content
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "name": name,
-                "content": content,
-            }
-        )
-
-        return field_dict
+        return {
+            "role": self.role.value,
+            "name": self.name,
+            "content": content,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        role = CreateChatCompletionJsonBodyMessagesItemType4Role(d.pop("role"))
+        role = CreateChatCompletionJsonBodyMessagesItemType4Role(src_dict["role"])
 
-        name = d.pop("name")
+        name = src_dict["name"]
 
         def _parse_content(data: object) -> Union[CreateChatCompletionJsonBodyMessagesItemType4ContentType1, str]:
             try:
@@ -72,7 +63,7 @@ class CreateChatCompletionJsonBodyMessagesItemType4:
                 pass
             return cast(Union[CreateChatCompletionJsonBodyMessagesItemType4ContentType1, str], data)
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
         create_chat_completion_json_body_messages_item_type_4 = cls(
             role=role,
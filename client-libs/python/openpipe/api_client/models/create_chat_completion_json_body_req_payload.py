@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Type, TypeVar, Union
 
 from attrs import define
 
@@ -8,48 +8,53 @@ from ..models.create_chat_completion_json_body_req_payload_function_call_type_0
 from ..models.create_chat_completion_json_body_req_payload_function_call_type_1 import (
     CreateChatCompletionJsonBodyReqPayloadFunctionCallType1,
 )
+from ..models.create_chat_completion_json_body_req_payload_function_call_type_2 import (
+    CreateChatCompletionJsonBodyReqPayloadFunctionCallType2,
+)
+from ..models.create_chat_completion_json_body_req_payload_functions_item import (
+    CreateChatCompletionJsonBodyReqPayloadFunctionsItem,
+)
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_0 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType0,
+)
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType1,
+)
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType2,
+)
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_3 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType3,
+)
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_4 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType4,
+)
 from ..models.create_chat_completion_json_body_req_payload_tool_choice_type_0 import (
     CreateChatCompletionJsonBodyReqPayloadToolChoiceType0,
 )
 from ..models.create_chat_completion_json_body_req_payload_tool_choice_type_1 import (
     CreateChatCompletionJsonBodyReqPayloadToolChoiceType1,
 )
+from ..models.create_chat_completion_json_body_req_payload_tool_choice_type_2 import (
+    CreateChatCompletionJsonBodyReqPayloadToolChoiceType2,
+)
+from ..models.create_chat_completion_json_body_req_payload_tools_item import (
+    CreateChatCompletionJsonBodyReqPayloadToolsItem,
+)
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_req_payload_function_call_type_2 import (
-        CreateChatCompletionJsonBodyReqPayloadFunctionCallType2,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_functions_item import (
-        CreateChatCompletionJsonBodyReqPayloadFunctionsItem,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_0 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType0,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType1,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType2,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_3 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType3,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_4 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType4,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_tool_choice_type_2 import (
-        CreateChatCompletionJsonBodyReqPayloadToolChoiceType2,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_tools_item import (
-        CreateChatCompletionJsonBodyReqPayloadToolsItem,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayload")
 
+_MESSAGES_ITEM_TYPES: Dict[str, Any] = {
+    "system": CreateChatCompletionJsonBodyReqPayloadMessagesItemType0,
+    "user": CreateChatCompletionJsonBodyReqPayloadMessagesItemType1,
+    "assistant": CreateChatCompletionJsonBodyReqPayloadMessagesItemType2,
+    "tool": CreateChatCompletionJsonBodyReqPayloadMessagesItemType3,
+    "function": CreateChatCompletionJsonBodyReqPayloadMessagesItemType4,
+}
+
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayload:
     """DEPRECATED. Use the top-level fields instead
 
@@ -104,38 +109,9 @@ class CreateChatCompletionJsonBodyReqPayload:
     stream: Union[Unset, bool] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_0 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType0,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType1,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType2,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_3 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType3,
-        )
-
-        model = self.model
         messages = []
         for messages_item_data in self.messages:
-            messages_item: Dict[str, Any]
-
-            if isinstance(messages_item_data, CreateChatCompletionJsonBodyReqPayloadMessagesItemType0):
-                messages_item = messages_item_data.to_dict()
-
-            elif isinstance(messages_item_data, CreateChatCompletionJsonBodyReqPayloadMessagesItemType1):
-                messages_item = messages_item_data.to_dict()
-
-            elif isinstance(messages_item_data, CreateChatCompletionJsonBodyReqPayloadMessagesItemType2):
-                messages_item = messages_item_data.to_dict()
-
-            elif isinstance(messages_item_data, CreateChatCompletionJsonBodyReqPayloadMessagesItemType3):
-                messages_item = messages_item_data.to_dict()
-
-            else:
-                messages_item = messages_item_data.to_dict()
+            messages_item = messages_item_data.to_dict()
 
             messages.append(messages_item)
 
@@ -193,18 +169,10 @@ class CreateChatCompletionJsonBodyReqPayload:
 
                 tools.append(tools_item)
 
-        n = self.n
-        max_tokens = self.max_tokens
-        temperature = self.temperature
-        stream = self.stream
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "model": model,
-                "messages": messages,
-            }
-        )
+        field_dict: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+        }
         if function_call is not UNSET:
             field_dict["function_call"] = function_call
         if functions is not UNSET:
@@ -213,102 +181,31 @@ class CreateChatCompletionJsonBodyReqPayload:
             field_dict["tool_choice"] = tool_choice
         if tools is not UNSET:
             field_dict["tools"] = tools
-        if n is not UNSET:
-            field_dict["n"] = n
-        if max_tokens is not UNSET:
-            field_dict["max_tokens"] = max_tokens
-        if temperature is not UNSET:
-            field_dict["temperature"] = temperature
-        if stream is not UNSET:
-            field_dict["stream"] = stream
+        if self.n is not UNSET:
+            field_dict["n"] = self.n
+        if self.max_tokens is not UNSET:
+            field_dict["max_tokens"] = self.max_tokens
+        if self.temperature is not UNSET:
+            field_dict["temperature"] = self.temperature
+        if self.stream is not UNSET:
+            field_dict["stream"] = self.stream
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_req_payload_function_call_type_2 import (
-            CreateChatCompletionJsonBodyReqPayloadFunctionCallType2,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_functions_item import (
-            CreateChatCompletionJsonBodyReqPayloadFunctionsItem,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_0 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType0,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType1,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType2,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_3 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType3,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_4 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType4,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_tool_choice_type_2 import (
-            CreateChatCompletionJsonBodyReqPayloadToolChoiceType2,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_tools_item import (
-            CreateChatCompletionJsonBodyReqPayloadToolsItem,
-        )
-
-        d = src_dict.copy()
-        model = d.pop("model")
+        model = src_dict["model"]
 
         messages = []
-        _messages = d.pop("messages")
+        _messages = src_dict["messages"]
         for messages_item_data in _messages:
-
-            def _parse_messages_item(
-                data: object,
-            ) -> Union[
-                "CreateChatCompletionJsonBodyReqPayloadMessagesItemType0",
-                "CreateChatCompletionJsonBodyReqPayloadMessagesItemType1",
-                "CreateChatCompletionJsonBodyReqPayloadMessagesItemType2",
-                "CreateChatCompletionJsonBodyReqPayloadMessagesItemType3",
-                "CreateChatCompletionJsonBodyReqPayloadMessagesItemType4",
-            ]:
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_0 = CreateChatCompletionJsonBodyReqPayloadMessagesItemType0.from_dict(data)
-
-                    return messages_item_type_0
-                except:  # noqa: E722
-                    pass
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_1 = CreateChatCompletionJsonBodyReqPayloadMessagesItemType1.from_dict(data)
-
-                    return messages_item_type_1
-                except:  # noqa: E722
-                    pass
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_2 = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2.from_dict(data)
-
-                    return messages_item_type_2
-                except:  # noqa: E722
-                    pass
-                try:
-                    if not isinstance(data, dict):
-                        raise TypeError()
-                    messages_item_type_3 = CreateChatCompletionJsonBodyReqPayloadMessagesItemType3.from_dict(data)
-
-                    return messages_item_type_3
-                except:  # noqa: E722
-                    pass
-                if not isinstance(data, dict):
-                    raise TypeError()
-                messages_item_type_4 = CreateChatCompletionJsonBodyReqPayloadMessagesItemType4.from_dict(data)
-
-                return messages_item_type_4
-
-            messages_item = _parse_messages_item(messages_item_data)
+            if not isinstance(messages_item_data, dict):
+                raise TypeError()
+            # An unknown role falls back to the last variant, which rejects it as the old trial parsing did
+            messages_item_type = _MESSAGES_ITEM_TYPES.get(
+                messages_item_data.get("role"), CreateChatCompletionJsonBodyReqPayloadMessagesItemType4
+            )
+            messages_item = messages_item_type.from_dict(messages_item_data)
 
             messages.append(messages_item)
 
@@ -365,10 +262,10 @@ class CreateChatCompletionJsonBodyReqPayload:
 
             return function_call_type_2
 
-        function_call = _parse_function_call(d.pop("function_call", UNSET))
+        function_call = _parse_function_call(src_dict.get("function_call", UNSET))
 
         functions = []
-        _functions = d.pop("functions", UNSET)
+        _functions = src_dict.get("functions", UNSET)
         for functions_item_data in _functions or []:
             functions_item = CreateChatCompletionJsonBodyReqPayloadFunctionsItem.from_dict(functions_item_data)
 
@@ -423,22 +320,22 @@ class CreateChatCompletionJsonBodyReqPayload:
 
             return tool_choice_type_2
 
-        tool_choice = _parse_tool_choice(d.pop("tool_choice", UNSET))
+        tool_choice = _parse_tool_choice(src_dict.get("tool_choice", UNSET))
 
         tools = []
-        _tools = d.pop("tools", UNSET)
+        _tools = src_dict.get("tools", UNSET)
         for tools_item_data in _tools or []:
             tools_item = CreateChatCompletionJsonBodyReqPayloadToolsItem.from_dict(tools_item_data)
 
             tools.append(tools_item)
 
-        n = d.pop("n", UNSET)
+        n = src_dict.get("n", UNSET)
 
-        max_tokens = d.pop("max_tokens", UNSET)
+        max_tokens = src_dict.get("max_tokens", UNSET)
 
-        temperature = d.pop("temperature", UNSET)
+        temperature = src_dict.get("temperature", UNSET)
 
-        stream = d.pop("stream", UNSET)
+        stream = src_dict.get("stream", UNSET)
 
         create_chat_completion_json_body_req_payload = cls(
             model=model,
@@ -5,7 +5,7 @@ from attrs import define
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadFunctionCallType2")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadFunctionCallType2:
     """
     Attributes:
@@ -15,21 +15,13 @@ class CreateChatCompletionJsonBodyReqPayloadFunctionCallType2:
     name: str
 
     def to_dict(self) -> Dict[str, Any]:
-        name = self.name
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "name": name,
-            }
-        )
-
-        return field_dict
+        return {
+            "name": self.name,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        name = d.pop("name")
+        name = src_dict["name"]
 
         create_chat_completion_json_body_req_payload_function_call_type_2 = cls(
             name=name,
@@ -1,7 +1,13 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_0 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0,
+)
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_1 import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1,
+)
 from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_2 import (
     CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType2,
 )
@@ -10,19 +16,10 @@ from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_
 )
 from ..types import UNSET
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_0 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_1 import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadMessagesItemType1")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1:
     """
     Attributes:
@@ -45,27 +42,12 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1:
     ]
 
     def to_dict(self) -> Dict[str, Any]:
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_0 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0,
-        )
-
-        role = self.role.value
-
         content: Union[List[Dict[str, Any]], str]
 
         if isinstance(self.content, list):
             content = []
             for content_type_1_item_data in self.content:
-                content_type_1_item: Dict[str, Any]
-
-                if isinstance(
-                    content_type_1_item_data,
-                    CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0,
-                ):
-                    content_type_1_item = content_type_1_item_data.to_dict()
-
-                else:
-                    content_type_1_item = content_type_1_item_data.to_dict()
+                content_type_1_item = content_type_1_item_data.to_dict()
 
                 content.append(content_type_1_item)
 
@@ -75,27 +57,14 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1:
         else:
             content = self.content
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "content": content,
-            }
-        )
-
-        return field_dict
+        return {
+            "role": self.role.value,
+            "content": content,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_0 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_1 import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1,
-        )
-
-        d = src_dict.copy()
-        role = CreateChatCompletionJsonBodyReqPayloadMessagesItemType1Role(d.pop("role"))
+        role = CreateChatCompletionJsonBodyReqPayloadMessagesItemType1Role(src_dict["role"])
 
         def _parse_content(
             data: object,
@@ -178,7 +147,7 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1:
                 data,
             )
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
         create_chat_completion_json_body_req_payload_messages_item_type_1 = cls(
             role=role,
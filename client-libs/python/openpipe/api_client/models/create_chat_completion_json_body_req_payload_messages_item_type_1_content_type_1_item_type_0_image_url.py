@@ -16,7 +16,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0ImageUrl")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType0ImageUrl:
     """
     Attributes:
@@ -35,7 +35,6 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemTyp
     ] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        url = self.url
         detail: Union[Unset, str]
         if isinstance(self.detail, Unset):
             detail = UNSET
@@ -59,12 +58,9 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemTyp
             if not isinstance(self.detail, Unset):
                 detail = self.detail.value
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "url": url,
-            }
-        )
+        field_dict: Dict[str, Any] = {
+            "url": self.url,
+        }
         if detail is not UNSET:
             field_dict["detail"] = detail
 
@@ -72,8 +68,7 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemTyp
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        url = d.pop("url")
+        url = src_dict["url"]
 
         def _parse_detail(
             data: object,
@@ -142,7 +137,7 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemTyp
 
             return detail_type_2
 
-        detail = _parse_detail(d.pop("detail", UNSET))
+        detail = _parse_detail(src_dict.get("detail", UNSET))
 
         create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_0_image_url = cls(
             url=url,
@@ -9,7 +9,7 @@ from ..models.create_chat_completion_json_body_req_payload_messages_item_type_1_
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1:
     """
     Attributes:
@@ -21,26 +21,16 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemTyp
     text: str
 
     def to_dict(self) -> Dict[str, Any]:
-        type = self.type.value
-
-        text = self.text
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "type": type,
-                "text": text,
-            }
-        )
-
-        return field_dict
+        return {
+            "type": self.type.value,
+            "text": self.text,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        type = CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1Type(d.pop("type"))
+        type = CreateChatCompletionJsonBodyReqPayloadMessagesItemType1ContentType1ItemType1Type(src_dict["type"])
 
-        text = d.pop("text")
+        text = src_dict["text"]
 
         create_chat_completion_json_body_req_payload_messages_item_type_1_content_type_1_item_type_1 = cls(
             type=type,
@@ -1,28 +1,25 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 from attrs import define
 
 from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_content_type_1 import (
     CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ContentType1,
 )
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_function_call import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType2FunctionCall,
+)
 from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_role import (
     CreateChatCompletionJsonBodyReqPayloadMessagesItemType2Role,
 )
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem,
+)
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_function_call import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType2FunctionCall,
-    )
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadMessagesItemType2")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2:
     """
     Attributes:
@@ -38,8 +35,6 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2:
     tool_calls: Union[Unset, List["CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem"]] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        role = self.role.value
-
         content: str
 
         if isinstance(self.content, CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ContentType1):
@@ -60,13 +55,10 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2:
 
                 tool_calls.append(tool_calls_item)
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "content": content,
-            }
-        )
+        field_dict: Dict[str, Any] = {
+            "role": self.role.value,
+            "content": content,
+        }
         if function_call is not UNSET:
             field_dict["function_call"] = function_call
         if tool_calls is not UNSET:
@@ -76,15 +68,7 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_function_call import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType2FunctionCall,
-        )
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem,
-        )
-
-        d = src_dict.copy()
-        role = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2Role(d.pop("role"))
+        role = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2Role(src_dict["role"])
 
         def _parse_content(
             data: object,
@@ -106,9 +90,9 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2:
                 pass
             return cast(Union[CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ContentType1, str], data)
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
-        _function_call = d.pop("function_call", UNSET)
+        _function_call = src_dict.get("function_call", UNSET)
         function_call: Union[Unset, CreateChatCompletionJsonBodyReqPayloadMessagesItemType2FunctionCall]
         if isinstance(_function_call, Unset):
             function_call = UNSET
@@ -118,7 +102,7 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2:
             )
 
         tool_calls = []
-        _tool_calls = d.pop("tool_calls", UNSET)
+        _tool_calls = src_dict.get("tool_calls", UNSET)
         for tool_calls_item_data in _tool_calls or []:
             tool_calls_item = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem.from_dict(
                 tool_calls_item_data
@@ -1,21 +1,18 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item_function import (
+    CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemFunction,
+)
 from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item_type import (
     CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemType,
 )
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item_function import (
-        CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemFunction,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem:
     """
     Attributes:
@@ -29,36 +26,21 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItem:
     type: CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemType
 
     def to_dict(self) -> Dict[str, Any]:
-        id = self.id
-        function = self.function.to_dict()
-
-        type = self.type.value
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "id": id,
-                "function": function,
-                "type": type,
-            }
-        )
-
-        return field_dict
+        return {
+            "id": self.id,
+            "function": self.function.to_dict(),
+            "type": self.type.value,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item_function import (
-            CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemFunction,
-        )
-
-        d = src_dict.copy()
-        id = d.pop("id")
+        id = src_dict["id"]
 
         function = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemFunction.from_dict(
-            d.pop("function")
+            src_dict["function"]
         )
 
-        type = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemType(d.pop("type"))
+        type = CreateChatCompletionJsonBodyReqPayloadMessagesItemType2ToolCallsItemType(src_dict["type"])
 
         create_chat_completion_json_body_req_payload_messages_item_type_2_tool_calls_item = cls(
             id=id,
@@ -13,7 +13,7 @@ from ..types import UNSET
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadMessagesItemType4")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadMessagesItemType4:
     """
     Attributes:
@@ -27,9 +27,6 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType4:
     content: Union[CreateChatCompletionJsonBodyReqPayloadMessagesItemType4ContentType1, str]
 
     def to_dict(self) -> Dict[str, Any]:
-        role = self.role.value
-
-        name = self.name
         content: str
 
         if isinstance(self.content, CreateChatCompletionJsonBodyReqPayloadMessagesItemType4ContentType1):
@@ -38,23 +35,17 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType4:
         else:
             content = self.content
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "name": name,
-                "content": content,
-            }
-        )
-
-        return field_dict
+        return {
+            "role": self.role.value,
+            "name": self.name,
+            "content": content,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        role = CreateChatCompletionJsonBodyReqPayloadMessagesItemType4Role(d.pop("role"))
+        role = CreateChatCompletionJsonBodyReqPayloadMessagesItemType4Role(src_dict["role"])
 
-        name = d.pop("name")
+        name = src_dict["name"]
 
         def _parse_content(
             data: object,
@@ -76,7 +67,7 @@ class CreateChatCompletionJsonBodyReqPayloadMessagesItemType4:
                 pass
             return cast(Union[CreateChatCompletionJsonBodyReqPayloadMessagesItemType4ContentType1, str], data)
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
         create_chat_completion_json_body_req_payload_messages_item_type_4 = cls(
             role=role,
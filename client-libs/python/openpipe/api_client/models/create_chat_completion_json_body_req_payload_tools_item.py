@@ -1,21 +1,18 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_req_payload_tools_item_function import (
+    CreateChatCompletionJsonBodyReqPayloadToolsItemFunction,
+)
 from ..models.create_chat_completion_json_body_req_payload_tools_item_type import (
     CreateChatCompletionJsonBodyReqPayloadToolsItemType,
 )
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_req_payload_tools_item_function import (
-        CreateChatCompletionJsonBodyReqPayloadToolsItemFunction,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadToolsItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadToolsItem:
     """
     Attributes:
@@ -27,30 +24,16 @@ class CreateChatCompletionJsonBodyReqPayloadToolsItem:
     type: CreateChatCompletionJsonBodyReqPayloadToolsItemType
 
     def to_dict(self) -> Dict[str, Any]:
-        function = self.function.to_dict()
-
-        type = self.type.value
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "function": function,
-                "type": type,
-            }
-        )
-
-        return field_dict
+        return {
+            "function": self.function.to_dict(),
+            "type": self.type.value,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_req_payload_tools_item_function import (
-            CreateChatCompletionJsonBodyReqPayloadToolsItemFunction,
-        )
-
-        d = src_dict.copy()
-        function = CreateChatCompletionJsonBodyReqPayloadToolsItemFunction.from_dict(d.pop("function"))
+        function = CreateChatCompletionJsonBodyReqPayloadToolsItemFunction.from_dict(src_dict["function"])
 
-        type = CreateChatCompletionJsonBodyReqPayloadToolsItemType(d.pop("type"))
+        type = CreateChatCompletionJsonBodyReqPayloadToolsItemType(src_dict["type"])
 
         create_chat_completion_json_body_req_payload_tools_item = cls(
             function=function,
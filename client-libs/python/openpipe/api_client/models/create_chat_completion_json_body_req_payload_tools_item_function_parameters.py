@@ -5,18 +5,14 @@ from attrs import define, field
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyReqPayloadToolsItemFunctionParameters")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyReqPayloadToolsItemFunctionParameters:
     """ """
 
     additional_properties: Dict[str, Any] = field(init=False, factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-
-        return field_dict
+        return dict(self.additional_properties)
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
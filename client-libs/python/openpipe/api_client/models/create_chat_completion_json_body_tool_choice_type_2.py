@@ -1,22 +1,19 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union
+from typing import Any, Dict, Type, TypeVar, Union
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_tool_choice_type_2_function import (
+    CreateChatCompletionJsonBodyToolChoiceType2Function,
+)
 from ..models.create_chat_completion_json_body_tool_choice_type_2_type import (
     CreateChatCompletionJsonBodyToolChoiceType2Type,
 )
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_tool_choice_type_2_function import (
-        CreateChatCompletionJsonBodyToolChoiceType2Function,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyToolChoiceType2")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyToolChoiceType2:
     """
     Attributes:
@@ -37,7 +34,6 @@ class CreateChatCompletionJsonBodyToolChoiceType2:
             function = self.function.to_dict()
 
         field_dict: Dict[str, Any] = {}
-        field_dict.update({})
         if type is not UNSET:
             field_dict["type"] = type
         if function is not UNSET:
@@ -47,19 +43,14 @@ class CreateChatCompletionJsonBodyToolChoiceType2:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_tool_choice_type_2_function import (
-            CreateChatCompletionJsonBodyToolChoiceType2Function,
-        )
-
-        d = src_dict.copy()
-        _type = d.pop("type", UNSET)
+        _type = src_dict.get("type", UNSET)
         type: Union[Unset, CreateChatCompletionJsonBodyToolChoiceType2Type]
         if isinstance(_type, Unset):
             type = UNSET
         else:
             type = CreateChatCompletionJsonBodyToolChoiceType2Type(_type)
 
-        _function = d.pop("function", UNSET)
+        _function = src_dict.get("function", UNSET)
         function: Union[Unset, CreateChatCompletionJsonBodyToolChoiceType2Function]
         if isinstance(_function, Unset):
             function = UNSET
@@ -1,19 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar
 
 from attrs import define
 
+from ..models.create_chat_completion_json_body_tools_item_function import CreateChatCompletionJsonBodyToolsItemFunction
 from ..models.create_chat_completion_json_body_tools_item_type import CreateChatCompletionJsonBodyToolsItemType
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_json_body_tools_item_function import (
-        CreateChatCompletionJsonBodyToolsItemFunction,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionJsonBodyToolsItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionJsonBodyToolsItem:
     """
     Attributes:
@@ -25,30 +20,16 @@ class CreateChatCompletionJsonBodyToolsItem:
     type: CreateChatCompletionJsonBodyToolsItemType
 
     def to_dict(self) -> Dict[str, Any]:
-        function = self.function.to_dict()
-
-        type = self.type.value
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "function": function,
-                "type": type,
-            }
-        )
-
-        return field_dict
+        return {
+            "function": self.function.to_dict(),
+            "type": self.type.value,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_json_body_tools_item_function import (
-            CreateChatCompletionJsonBodyToolsItemFunction,
-        )
-
-        d = src_dict.copy()
-        function = CreateChatCompletionJsonBodyToolsItemFunction.from_dict(d.pop("function"))
+        function = CreateChatCompletionJsonBodyToolsItemFunction.from_dict(src_dict["function"])
 
-        type = CreateChatCompletionJsonBodyToolsItemType(d.pop("type"))
+        type = CreateChatCompletionJsonBodyToolsItemType(src_dict["type"])
 
         create_chat_completion_json_body_tools_item = cls(
             function=function,
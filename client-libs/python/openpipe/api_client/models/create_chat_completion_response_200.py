@@ -1,19 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type, TypeVar, Union
+from typing import Any, Dict, List, Type, TypeVar, Union
 
 from attrs import define
 
+from ..models.create_chat_completion_response_200_choices_item import CreateChatCompletionResponse200ChoicesItem
 from ..models.create_chat_completion_response_200_object import CreateChatCompletionResponse200Object
+from ..models.create_chat_completion_response_200_usage import CreateChatCompletionResponse200Usage
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_response_200_choices_item import CreateChatCompletionResponse200ChoicesItem
-    from ..models.create_chat_completion_response_200_usage import CreateChatCompletionResponse200Usage
-
-
 T = TypeVar("T", bound="CreateChatCompletionResponse200")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionResponse200:
     """
     Attributes:
@@ -33,11 +30,6 @@ class CreateChatCompletionResponse200:
     usage: Union[Unset, "CreateChatCompletionResponse200Usage"] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        id = self.id
-        object_ = self.object_.value
-
-        created = self.created
-        model = self.model
         choices = []
         for choices_item_data in self.choices:
             choices_item = choices_item_data.to_dict()
@@ -48,16 +40,13 @@ class CreateChatCompletionResponse200:
         if not isinstance(self.usage, Unset):
             usage = self.usage.to_dict()
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "id": id,
-                "object": object_,
-                "created": created,
-                "model": model,
-                "choices": choices,
-            }
-        )
+        field_dict: Dict[str, Any] = {
+            "id": self.id,
+            "object": self.object_.value,
+            "created": self.created,
+            "model": self.model,
+            "choices": choices,
+        }
         if usage is not UNSET:
             field_dict["usage"] = usage
 
@@ -65,26 +54,22 @@ class CreateChatCompletionResponse200:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_response_200_choices_item import CreateChatCompletionResponse200ChoicesItem
-        from ..models.create_chat_completion_response_200_usage import CreateChatCompletionResponse200Usage
-
-        d = src_dict.copy()
-        id = d.pop("id")
+        id = src_dict["id"]
 
-        object_ = CreateChatCompletionResponse200Object(d.pop("object"))
+        object_ = CreateChatCompletionResponse200Object(src_dict["object"])
 
-        created = d.pop("created")
+        created = src_dict["created"]
 
-        model = d.pop("model")
+        model = src_dict["model"]
 
         choices = []
-        _choices = d.pop("choices")
+        _choices = src_dict["choices"]
         for choices_item_data in _choices:
             choices_item = CreateChatCompletionResponse200ChoicesItem.from_dict(choices_item_data)
 
             choices.append(choices_item)
 
-        _usage = d.pop("usage", UNSET)
+        _usage = src_dict.get("usage", UNSET)
         usage: Union[Unset, CreateChatCompletionResponse200Usage]
         if isinstance(_usage, Unset):
             usage = UNSET
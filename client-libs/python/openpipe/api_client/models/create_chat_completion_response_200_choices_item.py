@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union
+from typing import Any, Dict, Type, TypeVar, Union
 
 from attrs import define
 
@@ -17,17 +17,14 @@ from ..models.create_chat_completion_response_200_choices_item_finish_reason_typ
 from ..models.create_chat_completion_response_200_choices_item_finish_reason_type_4 import (
     CreateChatCompletionResponse200ChoicesItemFinishReasonType4,
 )
-
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_response_200_choices_item_message import (
-        CreateChatCompletionResponse200ChoicesItemMessage,
-    )
-
+from ..models.create_chat_completion_response_200_choices_item_message import (
+    CreateChatCompletionResponse200ChoicesItemMessage,
+)
 
 T = TypeVar("T", bound="CreateChatCompletionResponse200ChoicesItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionResponse200ChoicesItem:
     """
     Attributes:
@@ -68,28 +65,14 @@ class CreateChatCompletionResponse200ChoicesItem:
         else:
             finish_reason = self.finish_reason.value
 
-        index = self.index
-        message = self.message.to_dict()
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "finish_reason": finish_reason,
-                "index": index,
-                "message": message,
-            }
-        )
-
-        return field_dict
+        return {
+            "finish_reason": finish_reason,
+            "index": self.index,
+            "message": self.message.to_dict(),
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_response_200_choices_item_message import (
-            CreateChatCompletionResponse200ChoicesItemMessage,
-        )
-
-        d = src_dict.copy()
-
         def _parse_finish_reason(
             data: object,
         ) -> Union[
@@ -137,11 +120,11 @@ class CreateChatCompletionResponse200ChoicesItem:
 
             return finish_reason_type_4
 
-        finish_reason = _parse_finish_reason(d.pop("finish_reason"))
+        finish_reason = _parse_finish_reason(src_dict["finish_reason"])
 
-        index = d.pop("index")
+        index = src_dict["index"]
 
-        message = CreateChatCompletionResponse200ChoicesItemMessage.from_dict(d.pop("message"))
+        message = CreateChatCompletionResponse200ChoicesItemMessage.from_dict(src_dict["message"])
 
         create_chat_completion_response_200_choices_item = cls(
             finish_reason=finish_reason,
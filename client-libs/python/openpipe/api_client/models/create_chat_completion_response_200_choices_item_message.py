@@ -1,28 +1,25 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
 
 from attrs import define
 
 from ..models.create_chat_completion_response_200_choices_item_message_content_type_1 import (
     CreateChatCompletionResponse200ChoicesItemMessageContentType1,
 )
+from ..models.create_chat_completion_response_200_choices_item_message_function_call import (
+    CreateChatCompletionResponse200ChoicesItemMessageFunctionCall,
+)
 from ..models.create_chat_completion_response_200_choices_item_message_role import (
     CreateChatCompletionResponse200ChoicesItemMessageRole,
 )
+from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item import (
+    CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem,
+)
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_response_200_choices_item_message_function_call import (
-        CreateChatCompletionResponse200ChoicesItemMessageFunctionCall,
-    )
-    from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item import (
-        CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionResponse200ChoicesItemMessage")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionResponse200ChoicesItemMessage:
     """
     Attributes:
@@ -38,8 +35,6 @@ class CreateChatCompletionResponse200ChoicesItemMessage:
     tool_calls: Union[Unset, List["CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem"]] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        role = self.role.value
-
         content: str
 
         if isinstance(self.content, CreateChatCompletionResponse200ChoicesItemMessageContentType1):
@@ -60,13 +55,10 @@ class CreateChatCompletionResponse200ChoicesItemMessage:
 
                 tool_calls.append(tool_calls_item)
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "role": role,
-                "content": content,
-            }
-        )
+        field_dict: Dict[str, Any] = {
+            "role": self.role.value,
+            "content": content,
+        }
         if function_call is not UNSET:
             field_dict["function_call"] = function_call
         if tool_calls is not UNSET:
@@ -76,15 +68,7 @@ class CreateChatCompletionResponse200ChoicesItemMessage:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_response_200_choices_item_message_function_call import (
-            CreateChatCompletionResponse200ChoicesItemMessageFunctionCall,
-        )
-        from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item import (
-            CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem,
-        )
-
-        d = src_dict.copy()
-        role = CreateChatCompletionResponse200ChoicesItemMessageRole(d.pop("role"))
+        role = CreateChatCompletionResponse200ChoicesItemMessageRole(src_dict["role"])
 
         def _parse_content(data: object) -> Union[CreateChatCompletionResponse200ChoicesItemMessageContentType1, str]:
             try:
@@ -102,9 +86,9 @@ class CreateChatCompletionResponse200ChoicesItemMessage:
                 pass
             return cast(Union[CreateChatCompletionResponse200ChoicesItemMessageContentType1, str], data)
 
-        content = _parse_content(d.pop("content"))
+        content = _parse_content(src_dict["content"])
 
-        _function_call = d.pop("function_call", UNSET)
+        _function_call = src_dict.get("function_call", UNSET)
         function_call: Union[Unset, CreateChatCompletionResponse200ChoicesItemMessageFunctionCall]
         if isinstance(_function_call, Unset):
             function_call = UNSET
@@ -112,7 +96,7 @@ class CreateChatCompletionResponse200ChoicesItemMessage:
             function_call = CreateChatCompletionResponse200ChoicesItemMessageFunctionCall.from_dict(_function_call)
 
         tool_calls = []
-        _tool_calls = d.pop("tool_calls", UNSET)
+        _tool_calls = src_dict.get("tool_calls", UNSET)
         for tool_calls_item_data in _tool_calls or []:
             tool_calls_item = CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem.from_dict(
                 tool_calls_item_data
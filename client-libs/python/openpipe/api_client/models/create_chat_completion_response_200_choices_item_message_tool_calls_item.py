@@ -1,21 +1,18 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar
+from typing import Any, Dict, Type, TypeVar
 
 from attrs import define
 
+from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item_function import (
+    CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemFunction,
+)
 from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item_type import (
     CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemType,
 )
 
-if TYPE_CHECKING:
-    from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item_function import (
-        CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemFunction,
-    )
-
-
 T = TypeVar("T", bound="CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem:
     """
     Attributes:
@@ -29,34 +26,21 @@ class CreateChatCompletionResponse200ChoicesItemMessageToolCallsItem:
     type: CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemType
 
     def to_dict(self) -> Dict[str, Any]:
-        id = self.id
-        function = self.function.to_dict()
-
-        type = self.type.value
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "id": id,
-                "function": function,
-                "type": type,
-            }
-        )
-
-        return field_dict
+        return {
+            "id": self.id,
+            "function": self.function.to_dict(),
+            "type": self.type.value,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.create_chat_completion_response_200_choices_item_message_tool_calls_item_function import (
-            CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemFunction,
-        )
+        id = src_dict["id"]
 
-        d = src_dict.copy()
-        id = d.pop("id")
-
-        function = CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemFunction.from_dict(d.pop("function"))
+        function = CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemFunction.from_dict(
+            src_dict["function"]
+        )
 
-        type = CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemType(d.pop("type"))
+        type = CreateChatCompletionResponse200ChoicesItemMessageToolCallsItemType(src_dict["type"])
 
         create_chat_completion_response_200_choices_item_message_tool_calls_item = cls(
             id=id,
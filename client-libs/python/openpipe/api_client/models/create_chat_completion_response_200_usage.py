@@ -5,7 +5,7 @@ from attrs import define
 T = TypeVar("T", bound="CreateChatCompletionResponse200Usage")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class CreateChatCompletionResponse200Usage:
     """
     Attributes:
@@ -19,29 +19,19 @@ class CreateChatCompletionResponse200Usage:
     total_tokens: float
 
     def to_dict(self) -> Dict[str, Any]:
-        prompt_tokens = self.prompt_tokens
-        completion_tokens = self.completion_tokens
-        total_tokens = self.total_tokens
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "prompt_tokens": prompt_tokens,
-                "completion_tokens": completion_tokens,
-                "total_tokens": total_tokens,
-            }
-        )
-
-        return field_dict
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        prompt_tokens = d.pop("prompt_tokens")
+        prompt_tokens = src_dict["prompt_tokens"]
 
-        completion_tokens = d.pop("completion_tokens")
+        completion_tokens = src_dict["completion_tokens"]
 
-        total_tokens = d.pop("total_tokens")
+        total_tokens = src_dict["total_tokens"]
 
         create_chat_completion_response_200_usage = cls(
             prompt_tokens=prompt_tokens,
@@ -1,22 +1,20 @@
 import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar
+from typing import Any, Dict, Optional, Type, TypeVar
 
 from attrs import define
 from dateutil.parser import isoparse
 
-if TYPE_CHECKING:
-    from ..models.local_testing_only_get_latest_logged_call_response_200_model_response import (
-        LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse,
-    )
-    from ..models.local_testing_only_get_latest_logged_call_response_200_tags import (
-        LocalTestingOnlyGetLatestLoggedCallResponse200Tags,
-    )
-
+from ..models.local_testing_only_get_latest_logged_call_response_200_model_response import (
+    LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse,
+)
+from ..models.local_testing_only_get_latest_logged_call_response_200_tags import (
+    LocalTestingOnlyGetLatestLoggedCallResponse200Tags,
+)
 
 T = TypeVar("T", bound="LocalTestingOnlyGetLatestLoggedCallResponse200")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class LocalTestingOnlyGetLatestLoggedCallResponse200:
     """
     Attributes:
@@ -32,42 +30,24 @@ class LocalTestingOnlyGetLatestLoggedCallResponse200:
     model_response: Optional["LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse"]
 
     def to_dict(self) -> Dict[str, Any]:
-        created_at = self.created_at.isoformat()
-
-        cache_hit = self.cache_hit
-        tags = self.tags.to_dict()
-
         model_response = self.model_response.to_dict() if self.model_response else None
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "createdAt": created_at,
-                "cacheHit": cache_hit,
-                "tags": tags,
-                "modelResponse": model_response,
-            }
-        )
-
-        return field_dict
+        return {
+            "createdAt": self.created_at.isoformat(),
+            "cacheHit": self.cache_hit,
+            "tags": self.tags.to_dict(),
+            "modelResponse": model_response,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.local_testing_only_get_latest_logged_call_response_200_model_response import (
-            LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse,
-        )
-        from ..models.local_testing_only_get_latest_logged_call_response_200_tags import (
-            LocalTestingOnlyGetLatestLoggedCallResponse200Tags,
-        )
-
-        d = src_dict.copy()
-        created_at = isoparse(d.pop("createdAt"))
+        created_at = isoparse(src_dict["createdAt"])
 
-        cache_hit = d.pop("cacheHit")
+        cache_hit = src_dict["cacheHit"]
 
-        tags = LocalTestingOnlyGetLatestLoggedCallResponse200Tags.from_dict(d.pop("tags"))
+        tags = LocalTestingOnlyGetLatestLoggedCallResponse200Tags.from_dict(src_dict["tags"])
 
-        _model_response = d.pop("modelResponse")
+        _model_response = src_dict["modelResponse"]
         model_response: Optional[LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse]
         if _model_response is None:
             model_response = None
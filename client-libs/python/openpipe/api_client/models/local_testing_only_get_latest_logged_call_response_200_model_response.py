@@ -7,7 +7,7 @@ from ..types import UNSET, Unset
 T = TypeVar("T", bound="LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse:
     """
     Attributes:
@@ -25,39 +25,29 @@ class LocalTestingOnlyGetLatestLoggedCallResponse200ModelResponse:
     resp_payload: Union[Unset, Any] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        id = self.id
-        status_code = self.status_code
-        error_message = self.error_message
-        req_payload = self.req_payload
-        resp_payload = self.resp_payload
-
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "id": id,
-                "statusCode": status_code,
-                "errorMessage": error_message,
-            }
-        )
-        if req_payload is not UNSET:
-            field_dict["reqPayload"] = req_payload
-        if resp_payload is not UNSET:
-            field_dict["respPayload"] = resp_payload
+        field_dict: Dict[str, Any] = {
+            "id": self.id,
+            "statusCode": self.status_code,
+            "errorMessage": self.error_message,
+        }
+        if self.req_payload is not UNSET:
+            field_dict["reqPayload"] = self.req_payload
+        if self.resp_payload is not UNSET:
+            field_dict["respPayload"] = self.resp_payload
 
         return field_dict
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-        id = d.pop("id")
+        id = src_dict["id"]
 
-        status_code = d.pop("statusCode")
+        status_code = src_dict["statusCode"]
 
-        error_message = d.pop("errorMessage")
+        error_message = src_dict["errorMessage"]
 
-        req_payload = d.pop("reqPayload", UNSET)
+        req_payload = src_dict.get("reqPayload", UNSET)
 
-        resp_payload = d.pop("respPayload", UNSET)
+        resp_payload = src_dict.get("respPayload", UNSET)
 
         local_testing_only_get_latest_logged_call_response_200_model_response = cls(
             id=id,
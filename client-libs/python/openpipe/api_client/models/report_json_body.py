@@ -1,17 +1,14 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, TypeVar, Union
+from typing import Any, Dict, Type, TypeVar, Union
 
 from attrs import define
 
+from ..models.report_json_body_tags import ReportJsonBodyTags
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.report_json_body_tags import ReportJsonBodyTags
-
-
 T = TypeVar("T", bound="ReportJsonBody")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class ReportJsonBody:
     """
     Attributes:
@@ -34,31 +31,22 @@ class ReportJsonBody:
     tags: Union[Unset, "ReportJsonBodyTags"] = UNSET
 
     def to_dict(self) -> Dict[str, Any]:
-        requested_at = self.requested_at
-        received_at = self.received_at
-        req_payload = self.req_payload
-        resp_payload = self.resp_payload
-        status_code = self.status_code
-        error_message = self.error_message
         tags: Union[Unset, Dict[str, Any]] = UNSET
         if not isinstance(self.tags, Unset):
             tags = self.tags.to_dict()
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "requestedAt": requested_at,
-                "receivedAt": received_at,
-            }
-        )
-        if req_payload is not UNSET:
-            field_dict["reqPayload"] = req_payload
-        if resp_payload is not UNSET:
-            field_dict["respPayload"] = resp_payload
-        if status_code is not UNSET:
-            field_dict["statusCode"] = status_code
-        if error_message is not UNSET:
-            field_dict["errorMessage"] = error_message
+        field_dict: Dict[str, Any] = {
+            "requestedAt": self.requested_at,
+            "receivedAt": self.received_at,
+        }
+        if self.req_payload is not UNSET:
+            field_dict["reqPayload"] = self.req_payload
+        if self.resp_payload is not UNSET:
+            field_dict["respPayload"] = self.resp_payload
+        if self.status_code is not UNSET:
+            field_dict["statusCode"] = self.status_code
+        if self.error_message is not UNSET:
+            field_dict["errorMessage"] = self.error_message
         if tags is not UNSET:
             field_dict["tags"] = tags
 
@@ -66,22 +54,19 @@ class ReportJsonBody:
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        from ..models.report_json_body_tags import ReportJsonBodyTags
-
-        d = src_dict.copy()
-        requested_at = d.pop("requestedAt")
+        requested_at = src_dict["requestedAt"]
 
-        received_at = d.pop("receivedAt")
+        received_at = src_dict["receivedAt"]
 
-        req_payload = d.pop("reqPayload", UNSET)
+        req_payload = src_dict.get("reqPayload", UNSET)
 
-        resp_payload = d.pop("respPayload", UNSET)
+        resp_payload = src_dict.get("respPayload", UNSET)
 
-        status_code = d.pop("statusCode", UNSET)
+        status_code = src_dict.get("statusCode", UNSET)
 
-        error_message = d.pop("errorMessage", UNSET)
+        error_message = src_dict.get("errorMessage", UNSET)
 
-        _tags = d.pop("tags", UNSET)
+        _tags = src_dict.get("tags", UNSET)
         tags: Union[Unset, ReportJsonBodyTags]
         if isinstance(_tags, Unset):
             tags = UNSET
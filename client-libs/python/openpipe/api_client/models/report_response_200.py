@@ -8,7 +8,7 @@ from ..models.report_response_200_status_type_1 import ReportResponse200StatusTy
 T = TypeVar("T", bound="ReportResponse200")
 
 
-@define
+@define(slots=True, eq=False, order=False)
 class ReportResponse200:
     """
     Attributes:
@@ -26,19 +26,12 @@ class ReportResponse200:
         else:
             status = self.status.value
 
-        field_dict: Dict[str, Any] = {}
-        field_dict.update(
-            {
-                "status": status,
-            }
-        )
-
-        return field_dict
+        return {
+            "status": status,
+        }
 
     @classmethod
     def from_dict(cls: Type[T], src_dict: Dict[str, Any]) -> T:
-        d = src_dict.copy()
-
         def _parse_status(data: object) -> Union[ReportResponse200StatusType0, ReportResponse200StatusType1]:
             try:
                 if not isinstance(data, str):
@@ -54,7 +47,7 @@ class ReportResponse200:
 
             return status_type_1
 
-        status = _parse_status(d.pop("status"))
+        status = _parse_status(src_dict["status"])
 
         report_response_200 = cls(
             status=status,
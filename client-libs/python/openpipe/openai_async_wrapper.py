@@ -18,25 +18,31 @@ from .api_client import errors
 from .shared import (
     report_async,
     configure_openpipe_client,
+    configure_openpipe_report_client,
     get_chat_completion_json,
 )
 
 
 class AsyncCompletionsWrapper(AsyncCompletions):
     openpipe_client: AuthenticatedClient
+    openpipe_report_client: AuthenticatedClient
 
     def __init__(
-        self, client: OriginalAsyncOpenAI, openpipe_client: AuthenticatedClient
+        self,
+        client: OriginalAsyncOpenAI,
+        openpipe_client: AuthenticatedClient,
+        openpipe_report_client: AuthenticatedClient,
     ) -> None:
         super().__init__(client)
         self.openpipe_client = openpipe_client
+        self.openpipe_report_client = openpipe_report_client
 
     async def create(
         cls, *args, **kwargs
     ) -> ChatCompletion | AsyncStream[ChatCompletionChunk]:
-        openpipe_options = kwargs.pop("openpipe", {})
+        openpipe_options = kwargs.pop("openpipe", None)
 
-        requested_at = int(time.time() * 1000)
+        requested_at = time.time_ns() // 1_000_000
         model = kwargs.get("model", "")
 
         try:
@@ -65,9 +71,9 @@ class AsyncCompletionsWrapper(AsyncCompletions):
                         try:
                             # This block will always execute when the generator exits.
                             # This ensures that cleanup and reporting operations are performed regardless of how the generator terminates.
-                            received_at = int(time.time() * 1000)
+                            received_at = time.time_ns() // 1_000_000
                             await report_async(
-                                configured_client=cls.openpipe_client,
+                                configured_client=cls.openpipe_report_client,
                                 openpipe_options=openpipe_options,
                                 requested_at=requested_at,
                                 received_at=received_at,
@@ -83,10 +89,10 @@ class AsyncCompletionsWrapper(AsyncCompletions):
 
                 return _gen()
             else:
-                received_at = int(time.time() * 1000)
+                received_at = time.time_ns() // 1_000_000
 
                 await report_async(
-                    configured_client=cls.openpipe_client,
+                    configured_client=cls.openpipe_report_client,
                     openpipe_options=openpipe_options,
                     requested_at=requested_at,
                     received_at=received_at,
@@ -96,11 +102,11 @@ class AsyncCompletionsWrapper(AsyncCompletions):
                 )
             return chat_completion
         except Exception as e:
-            received_at = int(time.time() * 1000)
+            received_at = time.time_ns() // 1_000_000
 
             if isinstance(e, OpenAIError):
                 await report_async(
-                    configured_client=cls.openpipe_client,
+                    configured_client=cls.openpipe_report_client,
                     openpipe_options=openpipe_options,
                     requested_at=requested_at,
                     received_at=received_at,
@@ -119,7 +125,7 @@ class AsyncCompletionsWrapper(AsyncCompletions):
                     pass
 
                 await report_async(
-                    configured_client=cls.openpipe_client,
+                    configured_client=cls.openpipe_report_client,
                     openpipe_options=openpipe_options,
                     requested_at=requested_at,
                     received_at=received_at,
@@ -135,15 +141,21 @@ class AsyncCompletionsWrapper(AsyncCompletions):
 
 class AsyncChatWrapper(AsyncChat):
     def __init__(
-        self, client: OriginalAsyncOpenAI, openpipe_client: AuthenticatedClient
+        self,
+        client: OriginalAsyncOpenAI,
+        openpipe_client: AuthenticatedClient,
+        openpipe_report_client: AuthenticatedClient,
     ) -> None:
         super().__init__(client)
-        self.completions = AsyncCompletionsWrapper(client, openpipe_client)
+        self.completions = AsyncCompletionsWrapper(
+            client, openpipe_client, openpipe_report_client
+        )
 
 
 class AsyncOpenAIWrapper(OriginalAsyncOpenAI):
     chat: AsyncChatWrapper
     openpipe_client: AuthenticatedClient
+    openpipe_report_client: AuthenticatedClient
 
     # Support auto-complete
     def __init__(
@@ -173,5 +185,8 @@ class AsyncOpenAIWrapper(OriginalAsyncOpenAI):
         )
 
         self.openpipe_client = configure_openpipe_client(openpipe)
+        self.openpipe_report_client = configure_openpipe_report_client(openpipe)
 
-        self.chat = AsyncChatWrapper(self, self.openpipe_client)
+        self.chat = AsyncChatWrapper(
+            self, self.openpipe_client, self.openpipe_report_client
+        )
@@ -19,22 +19,28 @@ from .shared import (
     report,
     get_chat_completion_json,
     configure_openpipe_client,
+    configure_openpipe_report_client,
 )
 
 
 class CompletionsWrapper(Completions):
     openpipe_client: AuthenticatedClient
+    openpipe_report_client: AuthenticatedClient
 
     def __init__(
-        self, client: OriginalOpenAI, openpipe_client: AuthenticatedClient
+        self,
+        client: OriginalOpenAI,
+        openpipe_client: AuthenticatedClient,
+        openpipe_report_client: AuthenticatedClient,
     ) -> None:
         super().__init__(client)
         self.openpipe_client = openpipe_client
+        self.openpipe_report_client = openpipe_report_client
 
     def create(cls, *args, **kwargs) -> ChatCompletion | Stream[ChatCompletionChunk]:
-        openpipe_options = kwargs.pop("openpipe", {})
+        openpipe_options = kwargs.pop("openpipe", None)
 
-        requested_at = int(time.time() * 1000)
+        requested_at = time.time_ns() // 1_000_000
         model = kwargs.get("model", "")
 
         try:
@@ -60,10 +66,10 @@ class CompletionsWrapper(Completions):
 
                         yield chunk
 
-                    received_at = int(time.time() * 1000)
+                    received_at = time.time_ns() // 1_000_000
 
                     report(
-                        configured_client=cls.openpipe_client,
+                        configured_client=cls.openpipe_report_client,
                         openpipe_options=openpipe_options,
                         requested_at=requested_at,
                         received_at=received_at,
@@ -74,10 +80,10 @@ class CompletionsWrapper(Completions):
 
                 return _gen()
             else:
-                received_at = int(time.time() * 1000)
+                received_at = time.time_ns() // 1_000_000
 
                 report(
-                    configured_client=cls.openpipe_client,
+                    configured_client=cls.openpipe_report_client,
                     openpipe_options=openpipe_options,
                     requested_at=requested_at,
                     received_at=received_at,
@@ -87,11 +93,11 @@ class CompletionsWrapper(Completions):
                 )
             return chat_completion
         except Exception as e:
-            received_at = int(time.time() * 1000)
+            received_at = time.time_ns() // 1_000_000
 
             if isinstance(e, OpenAIError):
                 report(
-                    configured_client=cls.openpipe_client,
+                    configured_client=cls.openpipe_report_client,
                     openpipe_options=openpipe_options,
                     requested_at=requested_at,
                     received_at=received_at,
@@ -110,7 +116,7 @@ class CompletionsWrapper(Completions):
                     pass
 
                 report(
-                    configured_client=cls.openpipe_client,
+                    configured_client=cls.openpipe_report_client,
                     openpipe_options=openpipe_options,
                     requested_at=requested_at,
                     received_at=received_at,
@@ -126,15 +132,21 @@ class CompletionsWrapper(Completions):
 
 class ChatWrapper(Chat):
     def __init__(
-        self, client: OriginalOpenAI, openpipe_client: AuthenticatedClient
+        self,
+        client: OriginalOpenAI,
+        openpipe_client: AuthenticatedClient,
+        openpipe_report_client: AuthenticatedClient,
     ) -> None:
         super().__init__(client)
-        self.completions = CompletionsWrapper(client, openpipe_client)
+        self.completions = CompletionsWrapper(
+            client, openpipe_client, openpipe_report_client
+        )
 
 
 class OpenAIWrapper(OriginalOpenAI):
     chat: ChatWrapper
     openpipe_client: AuthenticatedClient
+    openpipe_report_client: AuthenticatedClient
 
     # Support auto-complete
     def __init__(
@@ -164,5 +176,6 @@ class OpenAIWrapper(OriginalOpenAI):
         )
 
         self.openpipe_client = configure_openpipe_client(openpipe)
+        self.openpipe_report_client = configure_openpipe_report_client(openpipe)
 
-        self.chat = ChatWrapper(self, self.openpipe_client)
+        self.chat = ChatWrapper(self, self.openpipe_client, self.openpipe_report_client)
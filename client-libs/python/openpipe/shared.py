@@ -6,17 +6,49 @@ from openpipe.api_client.models.report_json_body_tags import (
     ReportJsonBodyTags,
 )
 from openai.types.chat import ChatCompletion
+import asyncio
+import atexit
+import httpx
+import logging
 import os
-import pkg_resources
-import json
-from typing import Any, Dict, List, Union
+import queue
+import threading
+from importlib.metadata import PackageNotFoundError, version as _pkg_version
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+_log = logging.getLogger("openpipe")
 
-def configure_openpipe_client(openpipe_options={}) -> AuthenticatedClient:
+try:
+    version = _pkg_version("openpipe")
+except PackageNotFoundError:
+    # Running from a source checkout that was never installed
+    version = "0.0.0+unknown"
+
+_BASE_TAGS = {"$sdk": "python", "$sdk.version": version}
+
+# Shared by every call that passes no extra tags. Reports only read it via to_dict().
+_DEFAULT_TAGS = ReportJsonBodyTags.from_dict(_BASE_TAGS)
+
+
+# Only report traffic is bounded: a hung report would otherwise stall a report worker
+# (and flush()) forever. Completions served by OpenPipe keep the unbounded default.
+_REPORT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+
+def configure_openpipe_client(
+    openpipe_options=None, timeout: Optional[httpx.Timeout] = None
+) -> AuthenticatedClient:
     configured_client = AuthenticatedClient(
         base_url="https://app.openpipe.ai/api/v1",
         token="",
         raise_on_unexpected_status=True,
+        # The httpx clients are built once per AuthenticatedClient and reused, so keep
+        # idle connections open long enough that consecutive reports skip the TCP/TLS
+        # handshake.
+        httpx_args={
+            "limits": httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+        },
+        timeout=timeout,
     )
 
     if os.environ.get("OPENPIPE_API_KEY"):
@@ -35,63 +67,222 @@ def configure_openpipe_client(openpipe_options={}) -> AuthenticatedClient:
     return configured_client
 
 
-def _get_tags(openpipe_options):
-    tags = openpipe_options.get("tags") or {}
-    tags["$sdk"] = "python"
-    tags["$sdk.version"] = pkg_resources.get_distribution("openpipe").version
+def configure_openpipe_report_client(openpipe_options=None) -> AuthenticatedClient:
+    return configure_openpipe_client(openpipe_options, timeout=_REPORT_TIMEOUT)
+
+
+def _get_tags(openpipe_options=None):
+    user_tags = openpipe_options.get("tags") if openpipe_options else None
+    if not user_tags:
+        return _DEFAULT_TAGS
+
+    # Merge into a fresh dict so the caller's tags are never mutated
+    tags = {**user_tags, **_BASE_TAGS}
 
-    return ReportJsonBodyTags.from_dict(tags)
+    report_tags = ReportJsonBodyTags()
+    report_tags.additional_properties = tags
+    return report_tags
 
 
-def _should_log_request(configured_client: AuthenticatedClient, openpipe_options={}):
-    if configured_client.token == "":
+def _should_log_request(configured_client: AuthenticatedClient, openpipe_options=None):
+    if not configured_client.token:
         return False
 
+    if openpipe_options is None:
+        return True
+
     return openpipe_options.get("log_request", True)
 
 
+def _snapshot_req_payload(req_payload):
+    # Reports are sent in the background, so copy the containers a caller is likely to
+    # reuse and mutate between calls (the request dict, its messages list and the
+    # message dicts). Everything else is shared rather than deep-copied on the hot path.
+    if not isinstance(req_payload, dict):
+        return req_payload
+
+    snapshot = dict(req_payload)
+    messages = snapshot.get("messages")
+    if isinstance(messages, list):
+        snapshot["messages"] = [
+            dict(message) if isinstance(message, dict) else message
+            for message in messages
+        ]
+    return snapshot
+
+
+def _build_report_body(openpipe_options=None, **kwargs) -> api_report.ReportJsonBody:
+    if "req_payload" in kwargs:
+        kwargs["req_payload"] = _snapshot_req_payload(kwargs["req_payload"])
+
+    return api_report.ReportJsonBody(
+        **kwargs,
+        tags=_get_tags(openpipe_options),
+    )
+
+
+# Sync reports are handed to a small pool of background threads. The queue is bounded so
+# a slow or unreachable API can't grow memory without limit; once it is full, reports are
+# dropped rather than blocking the caller.
+_REPORT_QUEUE_SIZE = 1000
+_REPORT_WORKERS = 4
+_REPORT_QUEUE: "queue.Queue[Tuple[AuthenticatedClient, api_report.ReportJsonBody]]" = (
+    queue.Queue(maxsize=_REPORT_QUEUE_SIZE)
+)
+_report_workers: List[threading.Thread] = []
+_report_worker_lock = threading.Lock()
+
+# How long interpreter exit waits for queued sync reports
+_EXIT_FLUSH_TIMEOUT = 5.0
+
+# Async reports run as tasks on the caller's event loop. Past this many in flight, new
+# reports are dropped, as with the sync queue, so callers never wait on the API.
+_MAX_PENDING_ASYNC_REPORTS = 100
+_pending_async_reports: Set["asyncio.Task[None]"] = set()
+
+
+def _drain_report_queue(report_queue: queue.Queue):
+    while True:
+        configured_client, json_body = report_queue.get()
+        try:
+            api_report.sync_detailed(client=configured_client, json_body=json_body)
+        except Exception as e:
+            # We don't want to break client apps if our API is down for some reason
+            _log.warning("Error reporting to OpenPipe: %s", e)
+        finally:
+            report_queue.task_done()
+
+
+def _ensure_report_workers():
+    if len(_report_workers) == _REPORT_WORKERS:
+        return
+
+    with _report_worker_lock:
+        while len(_report_workers) < _REPORT_WORKERS:
+            worker = threading.Thread(
+                target=_drain_report_queue,
+                args=(_REPORT_QUEUE,),
+                name=f"openpipe-report-{len(_report_workers)}",
+                daemon=True,
+            )
+            worker.start()
+            _report_workers.append(worker)
+
+
+def _reset_after_fork():
+    global _REPORT_QUEUE, _report_workers, _report_worker_lock
+
+    # The workers don't survive a fork, and whatever the parent had queued is still the
+    # parent's to send, so the child starts over with an empty queue
+    _REPORT_QUEUE = queue.Queue(maxsize=_REPORT_QUEUE_SIZE)
+    _report_workers = []
+    _report_worker_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+async def _send_report_async(
+    configured_client: AuthenticatedClient, json_body: api_report.ReportJsonBody
+):
+    try:
+        await api_report.asyncio_detailed(client=configured_client, json_body=json_body)
+    except asyncio.CancelledError:
+        # e.g. asyncio.run() returning before the report was sent
+        _log.warning(
+            "OpenPipe report was cancelled before it was sent. "
+            "Await openpipe.flush_async() before the event loop shuts down."
+        )
+        raise
+    except Exception as e:
+        # We don't want to break client apps if our API is down for some reason
+        _log.warning("Error reporting to OpenPipe: %s", e)
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Blocks until every report queued by the sync client has been sent, or until
+    `timeout` seconds have passed. Returns False if reports were still pending.
+    Called automatically at interpreter exit, with a bounded timeout.
+    """
+    report_queue = _REPORT_QUEUE
+    with report_queue.all_tasks_done:
+        return report_queue.all_tasks_done.wait_for(
+            lambda: not report_queue.unfinished_tasks, timeout
+        )
+
+
+async def flush_async():
+    """
+    Waits for every report scheduled by the async client on the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _pending_async_reports if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending)
+
+
+def _flush_at_exit():
+    if not _report_workers:
+        return
+
+    if not flush(timeout=_EXIT_FLUSH_TIMEOUT):
+        _log.warning(
+            "Exiting with %d OpenPipe report(s) not yet sent",
+            _REPORT_QUEUE.unfinished_tasks,
+        )
+
+
+atexit.register(_flush_at_exit)
+
+
 def report(
     configured_client: AuthenticatedClient,
-    openpipe_options={},
+    openpipe_options=None,
     **kwargs,
 ):
     if not _should_log_request(configured_client, openpipe_options):
         return
 
     try:
-        api_report.sync_detailed(
-            client=configured_client,
-            json_body=api_report.ReportJsonBody(
-                **kwargs,
-                tags=_get_tags(openpipe_options),
-            ),
-        )
+        json_body = _build_report_body(openpipe_options, **kwargs)
     except Exception as e:
-        # We don't want to break client apps if our API is down for some reason
-        print(f"Error reporting to OpenPipe: {e}")
-        print(e)
+        _log.warning("Error reporting to OpenPipe: %s", e)
+        return
+
+    # Build the httpx client here, before the workers share it; they would otherwise
+    # race to create it lazily and leave the losers' connection pools orphaned
+    configured_client.get_httpx_client()
+
+    _ensure_report_workers()
+    try:
+        _REPORT_QUEUE.put_nowait((configured_client, json_body))
+    except queue.Full:
+        _log.warning("OpenPipe report queue is full, dropping report")
 
 
 async def report_async(
     configured_client: AuthenticatedClient,
-    openpipe_options={},
+    openpipe_options=None,
     **kwargs,
 ):
     if not _should_log_request(configured_client, openpipe_options):
         return
 
     try:
-        await api_report.asyncio_detailed(
-            client=configured_client,
-            json_body=api_report.ReportJsonBody(
-                **kwargs,
-                tags=_get_tags(openpipe_options),
-            ),
-        )
+        json_body = _build_report_body(openpipe_options, **kwargs)
     except Exception as e:
-        # We don't want to break client apps if our API is down for some reason
-        print(f"Error reporting to OpenPipe: {e}")
-        print(e)
+        _log.warning("Error reporting to OpenPipe: %s", e)
+        return
+
+    if len(_pending_async_reports) >= _MAX_PENDING_ASYNC_REPORTS:
+        _log.warning("OpenPipe report queue is full, dropping report")
+        return
+
+    task = asyncio.create_task(_send_report_async(configured_client, json_body))
+    _pending_async_reports.add(task)
+    task.add_done_callback(_pending_async_reports.discard)
 
 
 def get_chat_completion_json(completion: ChatCompletion) -> Dict:
@@ -110,28 +301,28 @@ def get_chat_completion_json(completion: ChatCompletion) -> Dict:
         "content"
     }  # Set of fields to include even if they have None value
 
-    def serialize(data: Any) -> Union[Dict, List]:
+    def serialize(data: Any) -> Any:
         """
-        Custom serializer function for objects, arrays, and other types.
-        Excludes fields with None values unless specified.
+        Recursively converts objects, arrays, and dicts into plain JSON values.
+        Excludes object fields with None values unless specified.
         """
         if isinstance(data, list) or isinstance(data, tuple):
             # Recursively process each element in the list or tuple
             return [serialize(item) for item in data]
 
+        if isinstance(data, dict):
+            return {key: serialize(value) for key, value in data.items()}
+
         if hasattr(data, "__dict__"):
             # Otherwise, use the __dict__ method to get attributes
-            data = data.__dict__
             # Filter out None values, except for specified fields
             return {
                 key: serialize(value)
-                if isinstance(value, (list, tuple, Dict))
-                else value
-                for key, value in data.items()
+                for key, value in data.__dict__.items()
                 if value is not None or key in include_null_fields
             }
 
         return data
 
-    # Serialize the object and then load it back as a dictionary
-    return json.loads(json.dumps(completion, default=serialize, indent=4))
+    # Walk the object directly instead of round-tripping it through a JSON string
+    return serialize(completion)
@@ -1,13 +1,20 @@
 from functools import reduce
 import pytest
 
-from . import AsyncOpenAI
+from . import AsyncOpenAI, flush_async
 from .merge_openai_chunks import merge_openai_chunks
-from .test_sync_client import function_call, function, last_logged_call
+from .test_sync_client import function_call, function
+from .test_sync_client import last_logged_call as sync_last_logged_call
 
 client = AsyncOpenAI()
 
 
+async def last_logged_call(client: AsyncOpenAI):
+    # Reports are sent from background tasks, so wait for them to land first
+    await flush_async()
+    return sync_last_logged_call(client)
+
+
 @pytest.fixture(autouse=True)
 def setup():
     print("\nresetting async client\n")
@@ -22,7 +29,7 @@ async def test_async_content():
         openpipe={"tags": {"promptId": "test_async_content"}},
     )
 
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"] == "count to 3"
     )
@@ -39,7 +46,7 @@ async def test_async_content_ft():
         openpipe={"tags": {"promptId": "test_async_content_ft"}},
     )
 
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"] == "count to 3"
     )
@@ -57,7 +64,7 @@ async def test_async_function_call():
         functions=[function],
         openpipe={"tags": {"promptId": "test_async_function_call"}},
     )
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"]
         == "tell me the weather in SF"
@@ -82,7 +89,7 @@ async def test_async_function_call_ft():
         functions=[function],
         openpipe={"tags": {"promptId": "test_async_function_call_ft"}},
     )
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"]
         == "tell me the weather in SF"
@@ -113,7 +120,7 @@ async def test_async_tool_calls():
         ],
         openpipe={"tags": {"promptId": "test_async_tool_calls"}},
     )
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"]
         == "tell me the weather in SF and Orlando"
@@ -144,7 +151,7 @@ async def test_async_tool_calls_ft():
         ],
         openpipe={"tags": {"promptId": "test_async_tool_calls_ft"}},
     )
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"]
         == "tell me the weather in SF and Orlando"
@@ -173,7 +180,7 @@ async def test_async_streaming_content():
     async for chunk in completion:
         merged = merge_openai_chunks(merged, chunk)
 
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.resp_payload["choices"][0]["message"]["content"]
         == merged.choices[0].message.content
@@ -194,7 +201,7 @@ async def test_async_streaming_function_call():
     async for chunk in completion:
         merged = merge_openai_chunks(merged, chunk)
 
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
 
     assert (
         last_logged.model_response.req_payload["messages"][0]["content"]
@@ -232,7 +239,7 @@ async def test_async_streaming_tool_calls():
     async for chunk in completion:
         merged = merge_openai_chunks(merged, chunk)
 
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.resp_payload["choices"][0]["message"]["tool_calls"][
             0
@@ -248,7 +255,7 @@ async def test_async_with_tags():
         openpipe={"tags": {"promptId": "test_async_with_tags"}},
     )
 
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.resp_payload["choices"][0]["message"]["content"]
         == completion.choices[0].message.content
@@ -268,7 +275,7 @@ async def test_bad_openai_call():
         assert False
     except Exception:
         pass
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert (
         last_logged.model_response.error_message
         == "The model `gpt-3.5-turbo-blaster` does not exist"
@@ -286,6 +293,6 @@ async def test_bad_openpipe_call():
         assert False
     except Exception:
         pass
-    last_logged = last_logged_call(client)
+    last_logged = await last_logged_call(client)
     assert last_logged.model_response.error_message == "The model does not exist"
     assert last_logged.model_response.status_code == 404
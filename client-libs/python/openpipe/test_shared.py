@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import queue
+import threading
+
+import httpx
+
+from . import shared
+from .api_client.client import AuthenticatedClient
+
+# These tests stub out the API calls, so they run without an OpenPipe project
+client = AuthenticatedClient(base_url="http://localhost", token="test-token")
+
+
+def report_kwargs(req_payload=None):
+    return {
+        "requested_at": 1700000000000,
+        "received_at": 1700000001000,
+        "req_payload": req_payload or {"model": "gpt-3.5-turbo", "messages": []},
+        "resp_payload": {},
+        "status_code": 200,
+    }
+
+
+def record_sync_reports(monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        shared.api_report,
+        "sync_detailed",
+        lambda client, json_body: sent.append(json_body),
+    )
+    return sent
+
+
+def test_report_is_sent_after_flush(monkeypatch):
+    sent = record_sync_reports(monkeypatch)
+
+    shared.report(client, **report_kwargs())
+
+    assert shared.flush(timeout=5)
+    assert len(sent) == 1
+    assert sent[0].status_code == 200
+
+
+def test_report_does_not_share_callers_tags_or_messages(monkeypatch):
+    sent = record_sync_reports(monkeypatch)
+    tags = {"prompt_id": "test"}
+    messages = [{"role": "user", "content": "Count to 3"}]
+
+    shared.report(
+        client,
+        openpipe_options={"tags": tags},
+        **report_kwargs({"model": "gpt-3.5-turbo", "messages": messages}),
+    )
+    # A caller reusing its request for the next call
+    messages[0]["content"] = "Count to 10"
+    messages.append({"role": "assistant", "content": "1, 2, 3"})
+
+    assert shared.flush(timeout=5)
+    assert tags == {"prompt_id": "test"}
+    assert sent[0].req_payload["messages"] == [
+        {"role": "user", "content": "Count to 3"}
+    ]
+    assert sent[0].tags.to_dict()["prompt_id"] == "test"
+    assert sent[0].tags.to_dict()["$sdk"] == "python"
+
+
+def test_report_failure_is_logged_not_raised(monkeypatch, caplog):
+    def fail(client, json_body):
+        raise httpx.ConnectError("OpenPipe is down")
+
+    monkeypatch.setattr(shared.api_report, "sync_detailed", fail)
+
+    with caplog.at_level(logging.WARNING, logger="openpipe"):
+        shared.report(client, **report_kwargs())
+        assert shared.flush(timeout=5)
+
+    assert "OpenPipe is down" in caplog.text
+
+
+def test_report_is_dropped_when_queue_is_full(monkeypatch, caplog):
+    # No workers, so nothing drains the queue
+    monkeypatch.setattr(shared, "_REPORT_QUEUE", queue.Queue(maxsize=1))
+    monkeypatch.setattr(shared, "_ensure_report_workers", lambda: None)
+
+    with caplog.at_level(logging.WARNING, logger="openpipe"):
+        shared.report(client, **report_kwargs())
+        shared.report(client, **report_kwargs())
+
+    assert shared._REPORT_QUEUE.qsize() == 1
+    assert "dropping report" in caplog.text
+    assert not shared.flush(timeout=0.01)
+
+
+async def test_flush_async_waits_only_for_current_loop(monkeypatch):
+    sent = []
+    release = asyncio.Event()
+
+    async def send(client, json_body):
+        await release.wait()
+        sent.append(json_body)
+
+    monkeypatch.setattr(shared.api_report, "asyncio_detailed", send)
+    monkeypatch.setattr(shared, "_pending_async_reports", set())
+
+    # Stands in for a report scheduled on another thread's event loop
+    other_loop = asyncio.new_event_loop()
+    other_report = other_loop.create_future()
+    shared._pending_async_reports.add(other_report)
+    try:
+        await shared.report_async(client, **report_kwargs())
+        assert sent == []
+
+        release.set()
+        await asyncio.wait_for(shared.flush_async(), timeout=5)
+
+        assert len(sent) == 1
+        assert not other_report.done()
+    finally:
+        other_report.cancel()
+        other_loop.close()
+
+
+def test_cancelled_async_report_is_logged(monkeypatch, caplog):
+    async def send(client, json_body):
+        await asyncio.sleep(3600)
+
+    monkeypatch.setattr(shared.api_report, "asyncio_detailed", send)
+    monkeypatch.setattr(shared, "_pending_async_reports", set())
+
+    async def main():
+        await shared.report_async(client, **report_kwargs())
+        # Give the report task a chance to start before asyncio.run() cancels it
+        await asyncio.sleep(0)
+
+    with caplog.at_level(logging.WARNING, logger="openpipe"):
+        # On its own thread so asyncio.run() leaves pytest-asyncio's loop alone
+        thread = threading.Thread(target=asyncio.run, args=(main(),))
+        thread.start()
+        thread.join()
+
+    assert "cancelled before it was sent" in caplog.text
+
+
+def test_only_report_client_has_a_timeout():
+    assert shared.configure_openpipe_client()._timeout is None
+    assert shared.configure_openpipe_report_client()._timeout is not None
+
+
+def test_report_builds_httpx_client_before_queueing(monkeypatch):
+    report_client = shared.configure_openpipe_report_client({"api_key": "test-token"})
+    monkeypatch.setattr(shared, "_ensure_report_workers", lambda: None)
+    monkeypatch.setattr(shared, "_REPORT_QUEUE", queue.Queue())
+
+    shared.report(report_client, **report_kwargs())
+
+    assert report_client._client is not None
+
+
+async def test_async_report_is_dropped_when_too_many_are_pending(monkeypatch, caplog):
+    def send(client, json_body):
+        raise AssertionError("report should have been dropped")
+
+    monkeypatch.setattr(shared.api_report, "asyncio_detailed", send)
+    monkeypatch.setattr(shared, "_MAX_PENDING_ASYNC_REPORTS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="openpipe"):
+        await shared.report_async(client, **report_kwargs())
+
+    assert "dropping report" in caplog.text
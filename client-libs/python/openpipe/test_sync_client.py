@@ -2,7 +2,7 @@ from functools import reduce
 import pytest
 import time
 
-from . import OpenAI
+from . import OpenAI, flush
 from .api_client.api.default import local_testing_only_get_latest_logged_call
 from .merge_openai_chunks import merge_openai_chunks
 
@@ -30,6 +30,8 @@ function = {
 
 
 def last_logged_call(client: OpenAI):
+    # Reports are sent in the background, so wait for them to land first
+    flush()
     return local_testing_only_get_latest_logged_call.sync(client=client.openpipe_client)
 
 